@@ -67,15 +67,26 @@ __all__ = [
 ]
 
 
+def represent_variable(representer: SafeRepresenter, data: Variable):
+    return representer.represent_data(data.value)
+
+
+def represent_str_enum(representer: SafeRepresenter, data: str):
+    # the libyaml emitter only accepts exact `str` scalars
+    return representer.represent_str(str(data))
+
+
 add_multi_representer(FlatDict, SafeRepresenter.represent_dict)
 SafeRepresenter.add_multi_representer(FlatDict, SafeRepresenter.represent_dict)
+add_multi_representer(Variable, represent_variable)
+SafeRepresenter.add_multi_representer(Variable, represent_variable)
 
 if StrEnum is not None:
-    add_multi_representer(StrEnum, SafeRepresenter.represent_str)
-    SafeRepresenter.add_multi_representer(StrEnum, SafeRepresenter.represent_str)
+    add_multi_representer(StrEnum, represent_str_enum)
+    SafeRepresenter.add_multi_representer(StrEnum, represent_str_enum)
 if UppercaseStrEnum is not None:
-    add_multi_representer(UppercaseStrEnum, SafeRepresenter.represent_str)
-    SafeRepresenter.add_multi_representer(UppercaseStrEnum, SafeRepresenter.represent_str)
+    add_multi_representer(UppercaseStrEnum, represent_str_enum)
+    SafeRepresenter.add_multi_representer(UppercaseStrEnum, represent_str_enum)
 if LowercaseStrEnum is not None:
-    add_multi_representer(LowercaseStrEnum, SafeRepresenter.represent_str)
-    SafeRepresenter.add_multi_representer(LowercaseStrEnum, SafeRepresenter.represent_str)
+    add_multi_representer(LowercaseStrEnum, represent_str_enum)
+    SafeRepresenter.add_multi_representer(LowercaseStrEnum, represent_str_enum)
@@ -19,28 +19,34 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable
 from contextlib import contextmanager
-from functools import wraps
 from typing import Any
 
 from typing_extensions import Self
 
 from .nested_dict import NestedDict
 from .parser import ConfigParser
-from .utils import NULL, Null
+from .utils import NULL, Null, get_annotations
 
+FROZEN_ERROR = "Attempting to alter a frozen config. Run config.defrost() to defrost first."
 
-def frozen_check(func: Callable):
+
+# `frozen` is owned by `Config`, the helpers below write it directly instead of going through `setattr`.
+def freeze(config: Any) -> None:
     r"""
-    Decorator check if the object is frozen.
+    Freeze `config` if it is a `Config`.
     """
 
-    @wraps(func)
-    def decorator(self, *args: Any, **kwargs: Any):
-        if self.getattr("frozen", False):
-            raise ValueError("Attempting to alter a frozen config. Run config.defrost() to defrost first.")
-        return func(self, *args, **kwargs)
+    if isinstance(config, dict) and isinstance(config, Config):
+        config.__dict__["frozen"] = True
+
+
+def defrost(config: Any) -> None:
+    r"""
+    Defrost `config` if it is a `Config`.
+    """
 
-    return decorator
+    if isinstance(config, dict) and isinstance(config, Config):
+        config.__dict__["frozen"] = False
 
 
 class Config(NestedDict):
@@ -335,11 +341,6 @@ class Config(NestedDict):
             True
         """
 
-        @wraps(self.freeze)
-        def freeze(config: Config) -> None:
-            if isinstance(config, Config):
-                config.setattr("frozen", True)
-
         if recursive:
             self.apply_(freeze)
         else:
@@ -407,11 +408,6 @@ class Config(NestedDict):
             False
         """
 
-        @wraps(self.defrost)
-        def defrost(config: Config) -> None:
-            if isinstance(config, Config):
-                config.setattr("frozen", False)
-
         if recursive:
             self.apply_(defrost)
         else:
@@ -495,10 +491,9 @@ class Config(NestedDict):
         if not self.hasattr("default_factory"):  # did not call super().__init__() in sub-class
             self.setattr("default_factory", Config)
         if name in self or not self.getattr("frozen", False):
-            return super().get(name, default, fallback)
+            return NestedDict.get(self, name, default, fallback)
         raise KeyError(name)
 
-    @frozen_check
     def set(
         self,
         name: Any,
@@ -534,9 +529,14 @@ class Config(NestedDict):
             1016
         """
 
-        return super().set(name, value, convert_mapping)
+        if self.__dict__.get("frozen", False):
+            raise ValueError(FROZEN_ERROR)
+        return NestedDict.set(self, name, value, convert_mapping)
+
+    def _bulk_mergeable(self) -> bool:
+        # `set` only adds the frozen check on top of `NestedDict.set`
+        return type(self).set is Config.set and not self.__dict__.get("frozen", False) and not get_annotations(self)
 
-    @frozen_check
     def delete(self, name: Any) -> None:
         r"""
         Delete value from `Config`.
@@ -565,9 +565,10 @@ class Config(NestedDict):
             AttributeError: 'Config' object has no attribute 'c'
         """
 
-        super().delete(name)
+        if self.__dict__.get("frozen", False):
+            raise ValueError(FROZEN_ERROR)
+        NestedDict.delete(self, name)
 
-    @frozen_check
     def pop(self, name: Any, default: Any = Null) -> Any:
         r"""
         Pop value from `Config`.
@@ -598,4 +599,6 @@ class Config(NestedDict):
             1016
         """
 
-        return super().pop(name, default)
+        if self.__dict__.get("frozen", False):
+            raise ValueError(FROZEN_ERROR)
+        return NestedDict.pop(self, name, default)
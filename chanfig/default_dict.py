@@ -80,7 +80,7 @@ class DefaultDict(FlatDict):
             default = self.getattr("default_factory")()
         if isinstance(default, FlatDict):
             default.__dict__.update(self.__dict__)
-        super().set(name, default)
+        FlatDict.set(self, name, default)
         return default
 
     def __repr__(self) -> str:
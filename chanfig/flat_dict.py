@@ -19,8 +19,10 @@
 
 from __future__ import annotations
 
+import builtins
+import copyreg
 from argparse import Namespace
-from collections.abc import Callable, Generator, Iterable, Mapping, MutableMapping, Sequence, Set
+from collections.abc import Callable, Generator, Iterable, Iterator, Mapping, MutableMapping, Sequence, Set
 from contextlib import contextmanager, suppress
 from copy import copy, deepcopy
 from dataclasses import asdict, is_dataclass
@@ -29,6 +31,7 @@ from json import dumps as json_dumps
 from json import loads as json_loads
 from os import PathLike
 from os.path import splitext
+from re import compile as re_compile
 from typing import IO, Any
 from warnings import warn
 
@@ -62,6 +65,40 @@ try:
 except ImportError:
     TORCH_AVAILABLE = False
 
+try:
+    from orjson import JSONDecodeError as OrjsonDecodeError
+    from orjson import loads as orjson_loads
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+SAVERS = {**dict.fromkeys(JSON, "json"), **dict.fromkeys(YAML, "yaml")}
+LOADERS = {**dict.fromkeys(JSON, "from_json"), **dict.fromkeys(YAML, "from_yaml")}
+# values may legitimately be `Null`, so lookups need a sentinel of their own
+MISSING = object()
+# leaves of these exact types are returned by `to_dict` as they are
+SCALAR_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+# orjson turns integers outside of 64 bits into floats, json keeps every integer exact
+LONG_DIGITS = re_compile(r"\d{19}")
+
+
+def class_attributes(cls: type) -> Mapping:
+    r"""
+    Annotated attributes that have a default value in the namespace of `cls`.
+
+    Examples:
+        >>> class A:
+        ...     a: int = 1
+        ...     b: int
+        ...     c = 3
+        >>> class_attributes(A)
+        {'a': 1}
+    """
+
+    namespace = cls.__dict__
+    return {k: namespace[k] for k in get_annotations(cls) if k in namespace}
+
 
 def to_dict(obj: Any, flatten: bool = False) -> Mapping | Sequence | Set:
     r"""
@@ -94,12 +131,15 @@ def to_dict(obj: Any, flatten: bool = False) -> Mapping | Sequence | Set:
         {'a': ({'b': 1},)}
     """
 
+    if type(obj) in SCALAR_TYPES:
+        return obj
     if flatten and isinstance(obj, FlatDict):
         return {k: to_dict(v) for k, v in obj.all_items()}
+    # scalar values are copied over in the comprehensions, only containers and objects recurse
     if isinstance(obj, Mapping):
-        return {k: to_dict(v) for k, v in obj.items()}
+        return {k: v if type(v) in SCALAR_TYPES else to_dict(v) for k, v in obj.items()}
     if isinstance(obj, list):
-        return [to_dict(v) for v in obj]
+        return [v if type(v) in SCALAR_TYPES else to_dict(v) for v in obj]
     if isinstance(obj, tuple):
         return tuple(to_dict(v) for v in obj)
     if isinstance(obj, set):
@@ -205,25 +245,29 @@ class FlatDict(dict, metaclass=Dict):
             self:
         """
 
-        def move_cls_attributes(cls: type) -> Mapping:
-            return {k: cls.__dict__[k] for k in get_annotations(cls).keys() if k in cls.__dict__}
-
-        if recursive:
-            for cls in self.__class__.__mro__:
-                self.merge(move_cls_attributes(cls), overwrite=False)
-        else:
-            self.merge(move_cls_attributes(self.__class__), overwrite=False)
+        for cls in self.__class__.__mro__ if recursive else (self.__class__,):
+            attributes = class_attributes(cls)
+            if attributes:
+                self.merge(attributes, overwrite=False)
         return self
 
     def __post_init__(self, *args, **kwargs) -> None:
         pass
 
     def __getattribute__(self, name: Any) -> Any:
-        if (name not in ("getattr",) and not (name.startswith("__") and name.endswith("__"))) and name in self:
-            if name in dir(self.__class__):
-                value = super().__getattribute__(name)
-                if isinstance(value, (property, staticmethod, classmethod)) or callable(value):
-                    return value
+        if name == "getattr" or (name.startswith("__") and name.endswith("__")):
+            return super().__getattribute__(name)
+        # methods and other class attributes are looked up far more often than values,
+        # resolve them against the class namespaces first instead of building `dir()` and walking nested names
+        for cls in type(self).__mro__:
+            if name in cls.__dict__:
+                if dict.__contains__(self, name):
+                    value = super().__getattribute__(name)
+                    if isinstance(value, (property, staticmethod, classmethod)) or callable(value):
+                        return value
+                    return self.get(name)
+                return super().__getattribute__(name)
+        if dict.__contains__(self, name) or name in self:
             return self.get(name)
         return super().__getattribute__(name)
 
@@ -261,13 +305,18 @@ class FlatDict(dict, metaclass=Dict):
             KeyError: 'f'
         """
 
-        if name in self:
-            return dict.__getitem__(self, name)
+        value = dict.get(self, name, MISSING)
+        if value is not MISSING:
+            return value
         if default is not Null:
             return default
         return self.__missing__(name)
 
     def __getitem__(self, name: Any) -> Any:
+        # stored names need neither resolution nor defaults, leave everything else to `get`
+        value = dict.get(self, name, MISSING)
+        if value is not MISSING:
+            return value
         return self.get(name, default=Null)
 
     def __getattr__(self, name: Any) -> Any:
@@ -421,11 +470,12 @@ class FlatDict(dict, metaclass=Dict):
         """
 
         try:
-            if name in self.__dict__:
-                return self.__dict__[name]
+            attributes = self.__dict__
+            if name in attributes:
+                return attributes[name]
             for cls in self.__class__.__mro__:
-                annotations = get_annotations(cls)
-                if name in cls.__dict__ and name not in annotations:
+                # names of annotated fields tell class attributes from defaults of fields, no need to evaluate them
+                if name in cls.__dict__ and name not in (getattr(cls, "__annotations__", None) or {}):
                     return cls.__dict__[name]
             return super().getattr(name, default)  # type: ignore[misc]
         except AttributeError:
@@ -798,6 +848,10 @@ class FlatDict(dict, metaclass=Dict):
         if not that:
             return this
         if isinstance(that, Mapping):
+            # fresh FlatDict without annotations has nothing to merge into or convert, fill it in bulk
+            if isinstance(this, FlatDict) and not this and type(this).set is FlatDict.set and not get_annotations(this):
+                dict.update(this, that)
+                return this
             that = that.items()
         for key, value in that:
             if key in this and isinstance(this[key], Mapping):
@@ -875,7 +929,8 @@ class FlatDict(dict, metaclass=Dict):
             other = self.empty(other).items()
         if not isinstance(other, Iterable):
             raise TypeError(f"`other={other}` should be of type Mapping, Iterable or PathStr, but got {type(other)}.")
-        return self.empty(**{key: value for key, value in other if key in self and self[key] == value})  # type: ignore
+        items = dict.items(self)
+        return self.empty(**{key: value for key, value in other if (key, value) in items})  # type: ignore
 
     def inter(self, other: Mapping | Iterable | PathStr, *args: Any, **kwargs: Any) -> Self:
         r"""
@@ -920,9 +975,8 @@ class FlatDict(dict, metaclass=Dict):
             other = self.empty(other).items()
         if not isinstance(other, Iterable):
             raise TypeError(f"`other={other}` should be of type Mapping, Iterable or PathStr, but got {type(other)}.")
-        return self.empty(
-            **{key: value for key, value in other if key not in self or self[key] != value}  # type: ignore[misc]
-        )
+        items = dict.items(self)
+        return self.empty(**{key: value for key, value in other if (key, value) not in items})  # type: ignore[misc]
 
     def diff(self, other: Mapping | Iterable | PathStr, *args: Any, **kwargs: Any) -> Self:
         r"""
@@ -1051,21 +1105,43 @@ class FlatDict(dict, metaclass=Dict):
 
         return copy(self)
 
-    def __deepcopy__(self, memo: Mapping | None = None) -> Self:
+    # values were converted when they were set on `self`,
+    # so pickling and copying below store them with `dict` methods instead of going through `set`
+    def __reduce__(self):
+        return copyreg.__newobj__, (self.__class__,), (self.__dict__, dict(self))
+
+    def __setstate__(self, state: Mapping | tuple[Mapping, Mapping]) -> None:
+        if isinstance(state, Mapping):
+            # pickled by earlier releases, items have already been restored through `__setitem__`
+            self.__dict__.update(state)
+            return
+        attributes, items = state
+        self.__dict__.update(attributes)
+        dict.update(self, items)
+
+    def __copy__(self) -> Self:
+        ret = self.__class__.__new__(self.__class__)
+        ret.__dict__.update(self.__dict__)
+        dict.update(ret, self)
+        return ret
+
+    def __deepcopy__(self, memo: builtins.dict[int, Any] | None = None) -> Self:
         # pylint: disable=C0103
 
-        if memo is not None and id(self) in memo:
+        if memo is None:
+            memo = {}
+        elif id(self) in memo:
             return memo[id(self)]
         ret = self.empty()
-        ret.__dict__.update(deepcopy(self.__dict__))
-        for k, v in self.items():
-            if isinstance(v, FlatDict):
-                ret[k] = v.deepcopy(memo=memo)
-            else:
-                ret[k] = deepcopy(v)
+        memo[id(self)] = ret
+        ret.__dict__.update(deepcopy(self.__dict__, memo))
+        for k, v in dict.items(self):
+            if type(v) not in SCALAR_TYPES:
+                v = deepcopy(v, memo)
+            dict.__setitem__(ret, k, v)
         return ret
 
-    def deepcopy(self, memo: Mapping | None = None) -> Self:  # pylint: disable=W0613
+    def deepcopy(self, memo: builtins.dict[int, Any] | None = None) -> Self:  # pylint: disable=W0613
         r"""
         Create a deep copy of `FlatDict`.
 
@@ -1093,7 +1169,7 @@ class FlatDict(dict, metaclass=Dict):
 
         return deepcopy(self)
 
-    def clone(self, memo: Mapping | None = None) -> Self:
+    def clone(self, memo: builtins.dict[int, Any] | None = None) -> Self:
         r"""
         Alias of [`deepcopy`][chanfig.FlatDict.deepcopy].
         """
@@ -1130,11 +1206,10 @@ class FlatDict(dict, metaclass=Dict):
                 raise ValueError("`method` must be specified when saving to IO.")
             method = splitext(file)[-1][1:]
         extension = method.lower()
-        if extension in YAML:
-            return self.yaml(file=file, *args, **kwargs)  # type: ignore[misc]  # noqa: B026
-        if extension in JSON:
-            return self.json(file=file, *args, **kwargs)  # type: ignore[misc]  # noqa: B026
-        raise TypeError(f"`file={file!r}` should be in {JSON} or {YAML}, but got {extension}.")
+        saver = SAVERS.get(extension)
+        if saver is None:
+            raise TypeError(f"`file={file!r}` should be in {JSON} or {YAML}, but got {extension}.")
+        return getattr(self, saver)(file=file, *args, **kwargs)  # type: ignore[misc]  # noqa: B026
 
     def dump(  # pylint: disable=W1113
         self, file: File, method: str = None, *args: Any, **kwargs: Any  # type: ignore[assignment]
@@ -1180,11 +1255,10 @@ class FlatDict(dict, metaclass=Dict):
                 raise ValueError("`method` must be specified when loading from IO.")
             method = splitext(file)[-1][1:]
         extension = method.lower()
-        if extension in JSON:
-            return cls.from_json(file, *args, **kwargs)
-        if extension in YAML:
-            return cls.from_yaml(file, *args, **kwargs)
-        raise TypeError(f"`file={file!r}` should be in {JSON} or {YAML}, but got {extension}.")
+        loader = LOADERS.get(extension)
+        if loader is None:
+            raise TypeError(f"`file={file!r}` should be in {JSON} or {YAML}, but got {extension}.")
+        return getattr(cls, loader)(file, *args, **kwargs)
 
     def json(self, file: File, *args: Any, **kwargs: Any) -> None:
         r"""
@@ -1257,6 +1331,10 @@ class FlatDict(dict, metaclass=Dict):
             [FlatDict(('a'): 1), FlatDict(('b'): 2), FlatDict(('c'): 3)]
         """
 
+        if ORJSON_AVAILABLE and not args and not kwargs and not LONG_DIGITS.search(string):
+            # orjson is stricter than json (e.g., `NaN`), let json decide
+            with suppress(OrjsonDecodeError):
+                return cls.from_dict(orjson_loads(string))
         return cls.from_dict(json_loads(string, *args, **kwargs))
 
     def yaml(self, file: File, *args: Any, **kwargs: Any) -> None:
@@ -1439,7 +1517,7 @@ class FlatDict(dict, metaclass=Dict):
         empty.__dict__.update(self.__dict__)
         return empty
 
-    def all_keys(self) -> Generator:
+    def all_keys(self) -> Iterator:
         r"""
         Equivalent to `keys`.
 
@@ -1448,9 +1526,9 @@ class FlatDict(dict, metaclass=Dict):
         See Also:
             [`all_keys`][chanfig.NestedDict.all_keys]
         """
-        yield from self.keys()
+        return iter(self.keys())
 
-    def all_values(self) -> Generator:
+    def all_values(self) -> Iterator:
         r"""
         Equivalent to `keys`.
 
@@ -1459,9 +1537,9 @@ class FlatDict(dict, metaclass=Dict):
         See Also:
             [`all_values`][chanfig.NestedDict.all_values]
         """
-        yield from self.values()
+        return iter(self.values())
 
-    def all_items(self) -> Generator:
+    def all_items(self) -> Iterator:
         r"""
         Equivalent to `keys`.
 
@@ -1470,7 +1548,7 @@ class FlatDict(dict, metaclass=Dict):
         See Also:
             [`all_items`][chanfig.NestedDict.all_items]
         """
-        yield from self.items()
+        return iter(self.items())
 
     def dropnull(self) -> Self:
         r"""
@@ -1511,38 +1589,27 @@ class FlatDict(dict, metaclass=Dict):
         # empty string will be split into list ['']
         if extra_repr:
             extra_lines = extra_repr.split("\n")
-        child_lines = []
-        for key, value in self.items():
-            key_repr = repr(key)
-            value_repr = repr(value)
-            value_repr = self._add_indent(value_repr)
-            child_lines.append(f"({key_repr}): {value_repr}")
-            # child_lines.append(f"{key_repr}: {value_repr}")
+        indent = self.getattr("indent", 2) * " "
+        child_lines = [f"({key!r}): {self._add_indent(repr(value), indent)}" for key, value in dict.items(self)]
         lines = extra_lines + child_lines
 
-        main_repr = self.__class__.__name__ + "("
-        if lines:
-            # simple one-liner info, which most builtin Modules will use
-            if len(extra_lines) == 1 and not child_lines:
-                main_repr += extra_lines[0]
-            elif len(child_lines) == 1 and not extra_lines and len(child_lines[0]) < 10:
-                main_repr += child_lines[0]
-            else:
-                main_repr += "\n  " + "\n  ".join(lines) + "\n"
-
-        main_repr += ")"
-        return main_repr
-
-    def _add_indent(self, text: str) -> str:
-        lines = text.split("\n")
+        name = self.__class__.__name__
+        if not lines:
+            return f"{name}()"
+        # simple one-liner info, which most builtin Modules will use
+        if len(extra_lines) == 1 and not child_lines:
+            return f"{name}({extra_lines[0]})"
+        if len(child_lines) == 1 and not extra_lines and len(child_lines[0]) < 10:
+            return f"{name}({child_lines[0]})"
+        return "".join((name, "(\n  ", "\n  ".join(lines), "\n)"))
+
+    def _add_indent(self, text: str, indent: str | None = None) -> str:
         # don't do anything for single-line stuff
-        if len(lines) == 1:
+        if "\n" not in text:
             return text
-        first = lines.pop(0)
-        lines = [(self.getattr("indent", 2) * " ") + line for line in lines]
-        text = "\n".join(lines)
-        text = first + "\n" + text
-        return text
+        if indent is None:
+            indent = self.getattr("indent", 2) * " "
+        return text.replace("\n", "\n" + indent)
 
     def __format__(self, format_spec: str) -> str:
         return repr(self.empty({k: v.__format__(format_spec) for k, v in self.all_items()}))
@@ -24,7 +24,7 @@ from typing import Any
 
 from yaml import dump as yaml_dump
 
-from .flat_dict import FlatDict, to_dict
+from .flat_dict import SAVERS, FlatDict, to_dict
 from .nested_dict import NestedDict
 from .utils import JSON, YAML, File, PathStr
 
@@ -66,11 +66,12 @@ def save(  # pylint: disable=W1113
             raise ValueError("`method` must be specified when saving to IO.")
         method = splitext(file)[-1][1:]
     extension = method.lower()
-    if extension in YAML:
+    saver = SAVERS.get(extension)
+    if saver == "yaml":
         with FlatDict.open(file, mode="w") as fp:  # pylint: disable=C0103
             yaml_dump(data, fp, *args, **kwargs)
         return
-    if extension in JSON:
+    if saver == "json":
         with FlatDict.open(file, mode="w") as fp:  # pylint: disable=C0103
             fp.write(json_dumps(data, *args, **kwargs))
         return
@@ -19,9 +19,10 @@ from __future__ import annotations
 
 from collections.abc import Callable, Generator, Iterable, Mapping
 from contextlib import contextmanager, nullcontext
-from functools import wraps
+from functools import lru_cache
 from inspect import ismethod
 from os import PathLike
+from sys import intern
 from typing import Any
 
 from typing_extensions import Self
@@ -36,7 +37,7 @@ except ImportError:
 
 from .default_dict import DefaultDict
 from .flat_dict import FlatDict
-from .utils import NULL, Null, PathStr
+from .utils import NULL, Null, PathStr, get_annotations
 from .variable import Variable
 
 
@@ -59,7 +60,7 @@ def apply(obj: Any, func: Callable, *args: Any, **kwargs: Any) -> Any:
         [`apply_`][chanfig.nested_dict.apply_]: Apply an in-place operation.
     """
 
-    if isinstance(obj, NestedDict):
+    if isinstance(obj, dict) and isinstance(obj, NestedDict):
         return obj.empty_like(**{k: apply(v, func, *args, **kwargs) for k, v in obj.items()})
     if isinstance(obj, Mapping):
         return {k: apply(v, func, *args, **kwargs) for k, v in obj.items()}
@@ -95,13 +96,36 @@ def apply_(obj: Any, func: Callable, *args: Any, **kwargs: Any) -> Any:
     """
     # pylint: disable=C0103
 
-    if isinstance(obj, Mapping):
-        for v in obj.values():
-            apply_(v, func, *args, **kwargs)
-    if isinstance(obj, (list, tuple, set)):
-        for v in obj:
-            apply_(v, func, *args, **kwargs)
-    return func(*args, **kwargs) if ismethod(func) else func(obj, *args, **kwargs)
+    # children are visited before their parent, the last call is therefore on `obj` itself
+    ret = None
+    stack: list = [(obj, False)]
+    while stack:
+        node, visited = stack.pop()
+        if visited:
+            ret = func(*args, **kwargs) if ismethod(func) else func(node, *args, **kwargs)
+            continue
+        stack.append((node, True))
+        if isinstance(node, (list, tuple, set)):
+            stack.extend((v, False) for v in reversed(list(node)))
+        if isinstance(node, Mapping):
+            stack.extend((v, False) for v in reversed(list(node.values())))
+    return ret
+
+
+@lru_cache(maxsize=4096)
+def split_name(name: str, separator: str) -> tuple[str, ...]:
+    r"""
+    Split a nested name by `separator`.
+
+    Names are split on every access and tend to repeat, so the results are cached.
+    Parts are interned, so that keys stored and looked up through nested names compare by identity.
+
+    Examples:
+        >>> split_name("a.b.c", ".")
+        ('a', 'b', 'c')
+    """
+
+    return tuple(intern(part) for part in name.split(separator))
 
 
 class NestedDict(DefaultDict):  # pylint: disable=E1136
@@ -194,19 +218,17 @@ class NestedDict(DefaultDict):  # pylint: disable=E1136
             ['a', 'b.c', 'b.d']
         """
 
-        separator = self.getattr("separator", ".")
-
-        @wraps(self.all_keys)
-        def all_keys(self, prefix=Null):
-            for key, value in self.items():
-                if prefix is not Null:
-                    key = str(prefix) + str(separator) + str(key)
-                if isinstance(value, NestedDict):
-                    yield from all_keys(value, key)
-                else:
-                    yield key
-
-        return all_keys(self)
+        separator = str(self.getattr("separator", "."))
+        stack: list = [(iter(self.items()), ())]
+        while stack:
+            items, prefix = stack[-1]
+            for key, value in items:
+                if isinstance(value, dict) and isinstance(value, NestedDict):
+                    stack.append((iter(value.items()), prefix + (str(key),)))
+                    break
+                yield separator.join(prefix + (str(key),)) if prefix else key
+            else:
+                stack.pop()
 
     def all_values(self) -> Generator:
         r"""
@@ -221,11 +243,15 @@ class NestedDict(DefaultDict):  # pylint: disable=E1136
             [1, 2, 3]
         """
 
-        for value in self.values():
-            if isinstance(value, NestedDict):
-                yield from value.all_values()
-            else:
+        stack: list = [iter(self.values())]
+        while stack:
+            for value in stack[-1]:
+                if isinstance(value, dict) and isinstance(value, NestedDict):
+                    stack.append(iter(value.values()))
+                    break
                 yield value
+            else:
+                stack.pop()
 
     def all_items(self) -> Generator:
         r"""
@@ -240,19 +266,17 @@ class NestedDict(DefaultDict):  # pylint: disable=E1136
             [('a', 1), ('b.c', 2), ('b.d', 3)]
         """
 
-        separator = self.getattr("separator", ".")
-
-        @wraps(self.all_items)
-        def all_items(self, prefix=Null):
-            for key, value in self.items():
-                if prefix is not Null:
-                    key = str(prefix) + str(separator) + str(key)
-                if isinstance(value, NestedDict):
-                    yield from all_items(value, key)
-                else:
-                    yield key, value
-
-        return all_items(self)
+        separator = str(self.getattr("separator", "."))
+        stack: list = [(iter(self.items()), ())]
+        while stack:
+            items, prefix = stack[-1]
+            for key, value in items:
+                if isinstance(value, dict) and isinstance(value, NestedDict):
+                    stack.append((iter(value.items()), prefix + (str(key),)))
+                    break
+                yield (separator.join(prefix + (str(key),)) if prefix else key), value
+            else:
+                stack.pop()
 
     def apply(self, func: Callable, *args: Any, **kwargs: Any) -> Self:
         r"""
@@ -365,30 +389,32 @@ class NestedDict(DefaultDict):  # pylint: disable=E1136
         """
 
         separator = self.getattr("separator", ".")
+        if not isinstance(name, str) or separator not in name:
+            return FlatDict.get(self, name, default)
         if fallback is None:
             fallback = self.getattr("fallback", False)
-        fallback_name = name.split(separator)[-1] if isinstance(name, str) else name
+        *keys, name = split_name(name, separator)
         fallback_value = Null
+        node = self
         try:
-            while isinstance(name, str) and separator in name:
-                if fallback and fallback_name in self:
-                    fallback_value = self.get(fallback_name)
-                name, rest = name.split(separator, 1)
-                self, name = self[name], rest  # pylint: disable=W0642
+            for key in keys:
+                if fallback and name in node:
+                    fallback_value = node.get(name)
+                node = node[key]
         except (KeyError, AttributeError, TypeError):
             if fallback and fallback_value is not Null:
                 return fallback_value
             if default is not Null:
                 return default
-            raise KeyError(name) from None
-        if (fallback and fallback_value is not Null) and (not isinstance(self, Iterable) or name not in self):
+            raise KeyError(key) from None
+        if (fallback and fallback_value is not Null) and (not isinstance(node, Iterable) or name not in node):
             return fallback_value
         # if value is a python dict
-        if not isinstance(self, NestedDict):
-            if name not in self and default is not Null:
+        if not isinstance(node, NestedDict):
+            if name not in node and default is not Null:
                 return default
-            return self[name]
-        return super().get(name, default)
+            return node[name]
+        return FlatDict.get(node, name, default)
 
     def set(  # pylint: disable=W0221
         self,
@@ -439,53 +465,56 @@ class NestedDict(DefaultDict):  # pylint: disable=E1136
             >>> d['e.f']['c.d']
             1
         """
-        # pylint: disable=W0642
 
         full_name = name
         separator = self.getattr("separator", ".")
         if convert_mapping is None:
             convert_mapping = self.getattr("convert_mapping", False)
-        default_factory = self.getattr("default_factory", self.empty) or self.empty
-        try:
-            while isinstance(name, str) and separator in name:
-                name, rest = name.split(separator, 1)
-                if name in dir(self) and isinstance(getattr(self.__class__, name), (property, cached_property)):
-                    self, name = getattr(self, name), rest
-                elif name not in self and isinstance(self, Mapping):
-                    default = (
-                        self.__missing__(name, default_factory()) if hasattr(self, "__missing__") else default_factory()
-                    )
-                    self, name = default, rest
-                else:
-                    self, name = self[name], rest
-                if isinstance(self, NestedDict):
-                    default_factory = self.getattr("default_factory", self.empty) or self.empty
-        except (AttributeError, TypeError):
-            raise KeyError(name) from None
-
-        if (
-            convert_mapping
-            and not isinstance(value, default_factory if isinstance(default_factory, type) else type(self))
-            and not isinstance(value, Variable)
-        ):
-            if isinstance(value, Mapping):
-                try:
-                    value = default_factory(**value)
-                except TypeError:
-                    value = default_factory(value)
-            if isinstance(value, list):
-                value = [default_factory(v) if isinstance(v, Mapping) else v for v in value]
-            if isinstance(value, tuple):
-                value = tuple(default_factory(v) if isinstance(v, Mapping) else v for v in value)
-            if isinstance(value, set):
-                value = {default_factory(v) if isinstance(v, Mapping) else v for v in list(value)}
-        if isinstance(self, NestedDict):
-            super().set(name, value)
-        elif isinstance(self, Mapping):
-            dict.__setitem__(self, name, value)
+        default_factory = None
+        node = self
+        if isinstance(name, str) and separator in name:
+            default_factory = node.getattr("default_factory", None) or node.empty
+            *keys, name = split_name(name, separator)
+            try:
+                for key in keys:
+                    if isinstance(getattr(node.__class__, key, None), (property, cached_property)):
+                        node = getattr(node, key)
+                    elif key not in node and isinstance(node, Mapping):
+                        node = (
+                            node.__missing__(key, default_factory())
+                            if hasattr(node, "__missing__")
+                            else default_factory()
+                        )
+                    else:
+                        node = node[key]
+                    if isinstance(node, NestedDict):
+                        default_factory = node.getattr("default_factory", None) or node.empty
+            except (AttributeError, TypeError):
+                raise KeyError(key) from None
+
+        if convert_mapping and isinstance(value, (Mapping, list, tuple, set)) and not isinstance(value, Variable):
+            # simple names do not walk down the tree, so `default_factory` is only resolved when needed
+            if default_factory is None:
+                default_factory = node.getattr("default_factory", None) or node.empty
+            if not isinstance(value, default_factory if isinstance(default_factory, type) else type(node)):
+                if isinstance(value, Mapping):
+                    try:
+                        value = default_factory(**value)
+                    except TypeError:
+                        value = default_factory(value)
+                if isinstance(value, list):
+                    value = [default_factory(v) if isinstance(v, Mapping) else v for v in value]
+                if isinstance(value, tuple):
+                    value = tuple(default_factory(v) if isinstance(v, Mapping) else v for v in value)
+                if isinstance(value, set):
+                    value = {default_factory(v) if isinstance(v, Mapping) else v for v in list(value)}
+        if isinstance(node, NestedDict):
+            FlatDict.set(node, name, value)
+        elif isinstance(node, Mapping):
+            dict.__setitem__(node, name, value)
         else:
             raise ValueError(
-                f"Cannot set `{full_name}` to `{value}`, as `{separator.join(full_name.split(separator)[:-1])}={self}`."
+                f"Cannot set `{full_name}` to `{value}`, as `{full_name.rpartition(separator)[0]}={node}`."
             )
 
     def delete(self, name: Any) -> None:
@@ -524,17 +553,19 @@ class NestedDict(DefaultDict):  # pylint: disable=E1136
         """
 
         separator = self.getattr("separator", ".")
-        try:
-            while isinstance(name, str) and separator in name:
-                name, rest = name.split(separator, 1)
-                self, name = self[name], rest  # pylint: disable=W0642
-        except (AttributeError, TypeError):
-            raise KeyError(name) from None
+        node = self
+        if isinstance(name, str) and separator in name:
+            *keys, name = split_name(name, separator)
+            try:
+                for key in keys:
+                    node = node[key]
+            except (AttributeError, TypeError):
+                raise KeyError(key) from None
         # if value is a python dict
-        if not isinstance(self, NestedDict):
-            del self[name]
+        if not isinstance(node, NestedDict):
+            del node[name]
             return
-        super().delete(name)
+        FlatDict.delete(node, name)
 
     def pop(self, name: Any, default: Any = Null) -> Any:
         r"""
@@ -565,17 +596,19 @@ class NestedDict(DefaultDict):  # pylint: disable=E1136
         """
 
         separator = self.getattr("separator", ".")
-        try:
-            while isinstance(name, str) and separator in name:
-                name, rest = name.split(separator, 1)
-                self, name = self[name], rest  # pylint: disable=W0642
-        except (AttributeError, TypeError):
-            raise KeyError(name) from None
-        if not isinstance(self, dict) or name not in self:
+        node = self
+        if isinstance(name, str) and separator in name:
+            *keys, name = split_name(name, separator)
+            try:
+                for key in keys:
+                    node = node[key]
+            except (AttributeError, TypeError):
+                raise KeyError(key) from None
+        if not isinstance(node, dict) or name not in node:
             if default is not Null:
                 return default
             raise KeyError(name)
-        return super().pop(name)
+        return dict.pop(node, name)
 
     def setdefault(  # type: ignore[override]  # pylint: disable=R0912,W0221
         self,
@@ -606,52 +639,54 @@ class NestedDict(DefaultDict):  # pylint: disable=E1136
             >>> d.setdefault("n.a.b.d", 2)
             2
         """
-        # pylint: disable=W0642
 
         full_name = name
         separator = self.getattr("separator", ".")
         if convert_mapping is None:
             convert_mapping = self.getattr("convert_mapping", False)
-        default_factory = self.getattr("default_factory", self.empty) or self.empty
-        try:
-            while isinstance(name, str) and separator in name:
-                name, rest = name.split(separator, 1)
-                if name in dir(self) and isinstance(getattr(self.__class__, name), (property, cached_property)):
-                    self, name = getattr(self, name), rest
-                elif name not in self and isinstance(self, Mapping):
-                    default = (
-                        self.__missing__(name, default_factory()) if hasattr(self, "__missing__") else default_factory()
-                    )
-                    self, name = default, rest
-                else:
-                    self, name = self[name], rest
-                if isinstance(self, NestedDict):
-                    default_factory = self.getattr("default_factory", self.empty) or self.empty
-        except (AttributeError, TypeError):
-            raise KeyError(name) from None
-
-        if isinstance(self, NestedDict) and name in self:
-            return super().get(name)
-        elif isinstance(self, Mapping) and name in self:
-            dict.__getitem__(self, name)
+        default_factory = self.getattr("default_factory", None) or self.empty
+        node = self
+        if isinstance(name, str) and separator in name:
+            *keys, name = split_name(name, separator)
+            try:
+                for key in keys:
+                    if isinstance(getattr(node.__class__, key, None), (property, cached_property)):
+                        node = getattr(node, key)
+                    elif key not in node and isinstance(node, Mapping):
+                        node = (
+                            node.__missing__(key, default_factory())
+                            if hasattr(node, "__missing__")
+                            else default_factory()
+                        )
+                    else:
+                        node = node[key]
+                    if isinstance(node, NestedDict):
+                        default_factory = node.getattr("default_factory", None) or node.empty
+            except (AttributeError, TypeError):
+                raise KeyError(key) from None
+
+        if isinstance(node, NestedDict) and name in node:
+            return FlatDict.get(node, name)
+        elif isinstance(node, Mapping) and name in node:
+            dict.__getitem__(node, name)
 
         if (
             convert_mapping
             and isinstance(value, Mapping)
-            and not isinstance(value, default_factory if isinstance(default_factory, type) else type(self))
+            and not isinstance(value, default_factory if isinstance(default_factory, type) else type(node))
             and not isinstance(value, Variable)
         ):
             try:
                 value = default_factory(**value)
             except TypeError:
                 value = default_factory(value)
-        if isinstance(self, NestedDict):
-            super().set(name, value)
-        elif isinstance(self, Mapping):
-            dict.__setitem__(self, name, value)
+        if isinstance(node, NestedDict):
+            FlatDict.set(node, name, value)
+        elif isinstance(node, Mapping):
+            dict.__setitem__(node, name, value)
         else:
             raise ValueError(
-                f"Cannot set `{full_name}` to `{value}`, as `{separator.join(full_name.split(separator)[:-1])}={self}`."
+                f"Cannot set `{full_name}` to `{value}`, as `{full_name.rpartition(separator)[0]}={node}`."
             )
         return value
 
@@ -707,15 +742,38 @@ class NestedDict(DefaultDict):  # pylint: disable=E1136
                     value.sort(key=key, reverse=reverse)
         return super().sort(key=key, reverse=reverse)
 
+    def _bulk_mergeable(self) -> bool:
+        # plain values under plain keys that are new to `self` can be stored as they are during `merge`,
+        # as long as `set` is not overridden to do more and there are no annotations to convert values to
+        return type(self).set is NestedDict.set and not get_annotations(self)
+
+    def _bulk_settable(self, key: Any, value: Any, separator: str, converted: tuple[type, ...]) -> bool:
+        return (
+            isinstance(key, str)
+            and separator not in key
+            and not dict.__contains__(self, key)
+            and (isinstance(value, converted) or not isinstance(value, (Mapping, list, tuple, set)))
+            and not isinstance(getattr(self.__class__, key, None), (property, cached_property))
+        )
+
     @staticmethod
     def _merge(this: FlatDict, that: Iterable, overwrite: bool = True) -> Mapping:
         if not that:
             return this
         if isinstance(that, Mapping):
             that = that.items()
+        bulk = isinstance(this, NestedDict) and this._bulk_mergeable()  # pylint: disable=W0212
+        separator: str = "."
+        converted: tuple[type, ...] = ()
+        if bulk:
+            separator = this.getattr("separator", ".")
+            default_factory = this.getattr("default_factory", None) or this.empty
+            converted = (default_factory if isinstance(default_factory, type) else type(this), Variable)
         with this.converting() if isinstance(this, NestedDict) else nullcontext():
             for key, value in that:
-                if key in this and isinstance(this[key], Mapping):
+                if bulk and this._bulk_settable(key, value, separator, converted):  # pylint: disable=W0212
+                    dict.__setitem__(this, key, value)
+                elif key in this and isinstance(this[key], Mapping):
                     if isinstance(value, Mapping):
                         NestedDict._merge(this[key], value, overwrite)
                     elif overwrite:
@@ -723,7 +781,9 @@ class NestedDict(DefaultDict):  # pylint: disable=E1136
                             this.set(key, value)
                         else:
                             this[key] = value
-                elif key in dir(this) and isinstance(getattr(this.__class__, key, None), (property, cached_property)):
+                elif isinstance(key, str) and isinstance(
+                    getattr(this.__class__, key, None), (property, cached_property)
+                ):
                     if isinstance(getattr(this, key, None), FlatDict):
                         getattr(this, key).merge(value, overwrite=overwrite)
                     else:
@@ -773,11 +833,12 @@ class NestedDict(DefaultDict):  # pylint: disable=E1136
         ret: NestedDict = NestedDict()
         for key, value in that:
             if key in this:
-                if isinstance(this[key], NestedDict) and isinstance(value, Mapping) and recursive:
-                    intersects = this[key].intersect(value)
+                current = this[key]
+                if isinstance(current, NestedDict) and isinstance(value, Mapping) and recursive:
+                    intersects = current.intersect(value)
                     if intersects:
                         ret[key] = intersects
-                elif this[key] == value:
+                elif current == value:
                     ret[key] = value
         return ret
 
@@ -822,32 +883,42 @@ class NestedDict(DefaultDict):  # pylint: disable=E1136
         for key, value in that:
             if key not in this:
                 ret[key] = value
-            elif isinstance(this[key], NestedDict) and isinstance(value, Mapping) and recursive:
-                differences = this[key].difference(value)
+                continue
+            current = this[key]
+            if isinstance(current, NestedDict) and isinstance(value, Mapping) and recursive:
+                differences = current.difference(value)
                 if differences:
                     ret[key] = differences
-            elif this[key] != value:
+            elif current != value:
                 ret[key] = value
         return ret
 
     @contextmanager
     def converting(self):
-        convert_mapping = self.getattr("convert_mapping", False)
+        # toggle the instance attribute in place, and leave no trace when it was inherited from the class
+        attributes = self.__dict__
+        convert_mapping = attributes.get("convert_mapping", Null)
         try:
-            self.setattr("convert_mapping", True)
+            attributes["convert_mapping"] = True
             yield
         finally:
-            self.setattr("convert_mapping", convert_mapping)
+            if convert_mapping is Null:
+                attributes.pop("convert_mapping", None)
+            else:
+                attributes["convert_mapping"] = convert_mapping
 
     def __contains__(self, name: Any) -> bool:
         separator = self.getattr("separator", ".")
+        node = self
         try:
-            while isinstance(name, str) and separator in name:
-                name, rest = name.split(separator, 1)
-                if super().__contains__(name):
-                    self, name = self[name], rest  # pylint: disable=W0642
-                else:
-                    return False
-            return super().__contains__(name)
-        except (TypeError, KeyError):  # TypeError when name is not in self
+            if isinstance(name, str) and separator in name:
+                *keys, name = split_name(name, separator)
+                for key in keys:
+                    if not dict.__contains__(node, key):
+                        return False
+                    node = dict.__getitem__(node, key)
+                    if not (isinstance(node, dict) and isinstance(node, NestedDict)):
+                        return False
+            return dict.__contains__(node, name)
+        except TypeError:  # unhashable name
             return False
@@ -21,7 +21,6 @@ import sys
 from argparse import ArgumentParser, Namespace, _StoreAction
 from ast import literal_eval
 from collections.abc import Sequence
-from contextlib import suppress
 from dataclasses import Field
 from inspect import isclass
 from typing import TYPE_CHECKING, Any
@@ -34,6 +33,7 @@ try:
 except ImportError:
     NoneType = type(None)  # type: ignore[misc, assignment]
 
+from .flat_dict import SCALAR_TYPES
 from .nested_dict import NestedDict
 from .utils import Null, get_annotations, parse_bool
 from .variable import Variable
@@ -41,6 +41,49 @@ from .variable import Variable
 if TYPE_CHECKING:
     from .config import Config
 
+# characters that a string accepted by `literal_eval` may start with, including whitespace, comments and continuations
+LITERAL_PREFIXES = frozenset("0123456789+-.([{'\"TFNbBrRuUs#\\ \t\n\r\f\v")
+# numbers never contain `/` or `:`, so values such as `./data/train` or `12:30` need not be parsed,
+# unless they also hold a string or a comment, as in `1, 'a/b'` or `0.5  # x:y`
+NUMBER_PREFIXES = frozenset("0123456789+-.")
+STRING_MARKERS = frozenset("'\"#")
+# command-line values repeat a lot (`True`, `0`, ...), scalar results can be shared safely
+LITERAL_CACHE: dict[str, Any] = {}
+LITERAL_CACHE_SIZE = 1024
+
+
+def eval_literal(value: str) -> Any:
+    r"""
+    Evaluate `value` as a Python literal, or return it unchanged if it is not one.
+
+    Strings that cannot start a literal are returned without invoking the parser.
+
+    Examples:
+        >>> eval_literal("[1, 2]")
+        [1, 2]
+        >>> eval_literal("path/to/file")
+        'path/to/file'
+        >>> eval_literal("1.0.0")
+        '1.0.0'
+        >>> eval_literal("./data/train")
+        './data/train'
+    """
+
+    if not value or value[0] not in LITERAL_PREFIXES:
+        return value
+    if value[0] in NUMBER_PREFIXES and ("/" in value or ":" in value) and STRING_MARKERS.isdisjoint(value):
+        return value
+    literal = LITERAL_CACHE.get(value, Null)
+    if literal is not Null:
+        return literal
+    try:
+        literal = literal_eval(value)
+    except (TypeError, ValueError, SyntaxError):
+        return value
+    if type(literal) in SCALAR_TYPES and len(LITERAL_CACHE) < LITERAL_CACHE_SIZE:
+        LITERAL_CACHE[value] = literal
+    return literal
+
 
 class ConfigParser(ArgumentParser):  # pylint: disable=C0115
     r"""
@@ -232,7 +275,7 @@ class ConfigParser(ArgumentParser):  # pylint: disable=C0115
         # add the command-line arguments
         key_value_args = []
         for arg in args:
-            if args == "--":
+            if arg == "--":
                 break
             if arg.startswith("-"):
                 key_value_args.append(arg.split("=", maxsplit=1))
@@ -240,8 +283,9 @@ class ConfigParser(ArgumentParser):  # pylint: disable=C0115
                 if not key_value_args:
                     continue
                 key_value_args[-1].append(arg)
+        actions = self._option_string_actions
         for key_value in key_value_args:
-            if key_value[0] not in self:
+            if key_value[0] not in actions:
                 if len(key_value) > 2:
                     self.add_argument(key_value[0], nargs="+")
                 else:
@@ -281,9 +325,9 @@ class ConfigParser(ArgumentParser):  # pylint: disable=C0115
         if eval_str:
             for key, value in parsed.all_items():
                 if isinstance(value, str):
-                    with suppress(TypeError, ValueError, SyntaxError):
-                        value = literal_eval(value)
-                    parsed[key] = value
+                    literal = eval_literal(value)
+                    if literal is not value:
+                        parsed[key] = literal
         return parsed
 
     def add_config_arguments(self, config: Config):
@@ -428,7 +428,7 @@ class ConfigRegistry(Registry):
         config_ = deepcopy(config)
 
         while "." in key:
-            key, rest = key.split(".", 1)
+            key, _, rest = key.partition(".")
             config_, key = getattr(config_, key), rest
         name = getattr(config_, key)
 
@@ -31,10 +31,15 @@ from typing import IO, Any, Union, no_type_check
 
 import typing_extensions
 from typing_extensions import get_args, get_origin
-from yaml import SafeDumper, SafeLoader
 from yaml.constructor import ConstructorError
 from yaml.nodes import ScalarNode, SequenceNode
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
+
 try:  # python 3.10+
     from types import UnionType  # type: ignore[attr-defined] # pylint: disable=C0412
 except ImportError:
@@ -217,6 +222,7 @@ def isvalid(data: Any, expected_type: type) -> bool:
     return isinstance(data, expected_type)
 
 
+# `isinstance` against classes created by `Dict` is slow on misses, callers rule out non-dicts first
 class Dict(type(dict)):  # type: ignore[misc]
     def __call__(cls, *args: Any, **kwargs: Any) -> Any:
         # if hasattr(cls, '__before_init__'):
@@ -294,9 +300,6 @@ class YamlDumper(SafeDumper):  # pylint: disable=R0903
     YAML Dumper for Config.
     """
 
-    def increase_indent(self, flow: bool = False, indentless: bool = False):  # pylint: disable=W0235
-        return super().increase_indent(flow, indentless)
-
 
 class YamlLoader(SafeLoader):
     r"""
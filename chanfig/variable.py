@@ -26,6 +26,9 @@ from .utils import Null
 
 V = TypeVar("V")
 
+# `copy` returns objects of these types as-is
+IMMUTABLE_TYPES = frozenset({int, float, complex, bool, str, bytes, tuple, frozenset, type(None)})
+
 
 class Variable(Generic[V]):  # pylint: disable=R0902
     r"""
@@ -336,6 +339,8 @@ class Variable(Generic[V]):  # pylint: disable=R0902
 
     @staticmethod
     def _get_value(obj) -> Any:
+        if type(obj) is Variable:  # pylint: disable=C0123
+            return obj._storage[0]
         if isinstance(obj, Variable):
             return obj.value
         return obj
@@ -344,117 +349,117 @@ class Variable(Generic[V]):  # pylint: disable=R0902
         return getattr(self.value, attr)
 
     def __lt__(self, other) -> bool:
-        return self.value < self._get_value(other)
+        return self._storage[0] < self._get_value(other)
 
     def __le__(self, other) -> bool:
-        return self.value <= self._get_value(other)
+        return self._storage[0] <= self._get_value(other)
 
     def __eq__(self, other) -> bool:
-        return self.value == self._get_value(other)
+        return self._storage[0] == self._get_value(other)
 
     def __ne__(self, other) -> bool:
-        return self.value != self._get_value(other)
+        return self._storage[0] != self._get_value(other)
 
     def __ge__(self, other) -> bool:
-        return self.value >= self._get_value(other)
+        return self._storage[0] >= self._get_value(other)
 
     def __gt__(self, other) -> bool:
-        return self.value > self._get_value(other)
+        return self._storage[0] > self._get_value(other)
 
     # def __index__(self):
     #     return self.value.__index__()
 
     def __invert__(self):
-        return ~self.value
+        return ~self._storage[0]
 
     def __abs__(self):
-        return abs(self.value)
+        return abs(self._storage[0])
 
     def __add__(self, other):
-        return Variable(self.value + self._get_value(other))
+        return Variable(self._storage[0] + self._get_value(other))
 
     def __radd__(self, other):
-        return Variable(self._get_value(other) + self.value)
+        return Variable(self._get_value(other) + self._storage[0])
 
     def __iadd__(self, other):
         self.value += self._get_value(other)
         return self
 
     def __and__(self, other):
-        return Variable(self.value & self._get_value(other))
+        return Variable(self._storage[0] & self._get_value(other))
 
     def __rand__(self, other):
-        return Variable(self._get_value(other) & self.value)
+        return Variable(self._get_value(other) & self._storage[0])
 
     def __iand__(self, other):
         self.value &= self._get_value(other)
         return self
 
     def __floordiv__(self, other):
-        return Variable(self.value // self._get_value(other))
+        return Variable(self._storage[0] // self._get_value(other))
 
     def __rfloordiv__(self, other):
-        return Variable(self._get_value(other) // self.value)
+        return Variable(self._get_value(other) // self._storage[0])
 
     def __ifloordiv__(self, other):
         self.value //= self._get_value(other)
         return self
 
     def __mod__(self, other):
-        return Variable(self.value % self._get_value(other))
+        return Variable(self._storage[0] % self._get_value(other))
 
     def __rmod__(self, other):
-        return Variable(self._get_value(other) % self.value)
+        return Variable(self._get_value(other) % self._storage[0])
 
     def __imod__(self, other):
         self.value %= self._get_value(other)
         return self
 
     def __mul__(self, other):
-        return Variable(self.value * self._get_value(other))
+        return Variable(self._storage[0] * self._get_value(other))
 
     def __rmul__(self, other):
-        return Variable(self._get_value(other) * self.value)
+        return Variable(self._get_value(other) * self._storage[0])
 
     def __imul__(self, other):
         self.value *= self._get_value(other)
         return self
 
     def __matmul__(self, other):
-        return Variable(self.value @ self._get_value(other))
+        return Variable(self._storage[0] @ self._get_value(other))
 
     def __rmatmul__(self, other):
-        return Variable(self._get_value(other) @ self.value)
+        return Variable(self._get_value(other) @ self._storage[0])
 
     def __imatmul__(self, other):
         self.value @= self._get_value(other)
         return self
 
     def __pow__(self, other):
-        return Variable(self.value ** self._get_value(other))
+        return Variable(self._storage[0] ** self._get_value(other))
 
     def __rpow__(self, other):
-        return Variable(self._get_value(other) ** self.value)
+        return Variable(self._get_value(other) ** self._storage[0])
 
     def __ipow__(self, other):
         self.value **= self._get_value(other)
         return self
 
     def __truediv__(self, other):
-        return Variable(self.value / self._get_value(other))
+        return Variable(self._storage[0] / self._get_value(other))
 
     def __rtruediv__(self, other):
-        return Variable(self._get_value(other) / self.value)
+        return Variable(self._get_value(other) / self._storage[0])
 
     def __itruediv__(self, other):
         self.value /= self._get_value(other)
         return self
 
     def __sub__(self, other):
-        return Variable(self.value - self._get_value(other))
+        return Variable(self._storage[0] - self._get_value(other))
 
     def __rsub__(self, other):
-        return Variable(self._get_value(other) - self.value)
+        return Variable(self._get_value(other) - self._storage[0])
 
     def __isub__(self, other):
         self.value -= self._get_value(other)
@@ -464,7 +469,10 @@ class Variable(Generic[V]):  # pylint: disable=R0902
         return Variable(self.value)
 
     def __deepcopy__(self, memo: Mapping | None = None):
-        return Variable(copy(self.value))
+        value = self._storage[0]
+        if type(value) not in IMMUTABLE_TYPES:
+            value = copy(value)
+        return Variable(value)
 
     def __format__(self, format_spec):
         return self.value if isinstance(self, str) else format(self.value, format_spec)
@@ -20,10 +20,11 @@ from __future__ import annotations
 from copy import copy, deepcopy
 from functools import partial
 from io import StringIO
+from pickle import dumps, loads
 
 from pytest import raises
 
-from chanfig import Config, Variable
+from chanfig import Config, NestedDict, Variable
 
 
 class DataConfig(Config):
@@ -145,6 +146,67 @@ class Test:
         assert config.copy() == copy(config)
         assert config.deepcopy() == deepcopy(config)
 
+    def test_deepcopy_frozen(self):
+        config = TestConfig()
+        config.freeze()
+        clone = config.deepcopy()
+        assert clone == config
+        assert clone.getattr("frozen")
+        assert clone.network.getattr("frozen")
+        assert clone.datas is not config.datas
+
+    def test_deepcopy_shared(self):
+        config = TestConfig()
+        config.alias = config.network
+        clone = config.deepcopy()
+        assert clone.alias is clone.network
+        assert clone.network is not config.network
+
+    def test_pickle(self):
+        config = Config(**{"network.name": "ResNet", "datas": ["a", "b"]})
+        config.freeze()
+        clone = loads(dumps(config))
+        assert clone == config
+        assert isinstance(clone.network, Config)
+        assert clone.getattr("frozen")
+        assert clone.network.getattr("frozen")
+
+    def test_pickle_legacy(self):
+        # pickled by earlier releases, which stored `__dict__` as the state and restored items with `__setitem__`
+        data = (
+            b"\x80\x02cchanfig.config\nConfig\nq\x00)\x81q\x01(X\x07\x00\x00\x00networkq\x02h\x00)\x81q\x03X\x04\x00"
+            b"\x00\x00nameq\x04X\x06\x00\x00\x00ResNetq\x05s}q\x06(X\x06\x00\x00\x00frozenq\x07\x88X\x0f\x00\x00\x00de"
+            b"fault_factoryq\x08h\x00X\x0f\x00\x00\x00convert_mappingq\t\x88ubX\x05\x00\x00\x00datasq\n]q\x0b(X\x01\x00"
+            b"\x00\x00aq\x0cX\x01\x00\x00\x00bq\reu}q\x0e(h\x07\x88h\x08h\x00h\t\x89ub."
+        )
+        config = loads(data)
+        assert config == Config(**{"network.name": "ResNet", "datas": ["a", "b"]})
+        assert isinstance(config.network, Config)
+        assert config.getattr("frozen")
+        assert config.network.getattr("frozen")
+
+    def test_copy_frozen(self):
+        config = TestConfig()
+        config.freeze()
+        clone = config.copy()
+        assert clone == config
+        assert clone.getattr("frozen")
+        assert clone.datas is config.datas
+
+    def test_bulk_merge(self, monkeypatch):
+        names = []
+        original = NestedDict.set
+
+        def spy(self, name, *args, **kwargs):
+            names.append(name)
+            return original(self, name, *args, **kwargs)
+
+        monkeypatch.setattr(NestedDict, "set", spy)
+        config = Config(a=1, b="x", c={"d": 2})
+        assert names == ["c"]
+        assert config.dict() == {"a": 1, "b": "x", "c": {"d": 2}}
+        assert isinstance(config.c, Config)
+
     def test_class_attribute(self):
         config = TestConfig()
         config.datas.a.name = "CIFAR100"
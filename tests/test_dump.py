@@ -18,7 +18,10 @@
 
 from enum import auto
 
-from chanfig import NestedDict
+import yaml
+
+from chanfig import NestedDict, Variable
+from chanfig.utils import YamlDumper
 
 try:
     from enum import StrEnum
@@ -44,3 +47,9 @@ class TestDump:
         config = TaskConfig()
         s = config.yamls()
         assert s == "task: regression\n"
+
+    def test_yaml_dump(self):
+        config = NestedDict({"a": Variable(1), "b": {"c": Variable([1, 2])}})
+        s = yaml.dump(config, Dumper=YamlDumper)
+        assert s == "a: 1\nb:\n  c:\n  - 1\n  - 2\n"
+        assert yaml.safe_dump(config) == s
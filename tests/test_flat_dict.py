@@ -49,6 +49,20 @@ class Test:
         assert copy(self.dict) == self.dict.copy()
         assert deepcopy(self.dict) == self.dict.deepcopy()
 
+    def test_jsons(self):
+        dict = FlatDict.from_jsons('{"a": 1, "b": {"c": [1, 2]}, "d": 0.5}')
+        assert dict["b"] == {"c": [1, 2]}
+        assert dict["d"] == 0.5
+        dict = FlatDict.from_jsons('{"a": 1, "b": {"c": [1, 2]}, "d": NaN}')
+        assert dict["b"] == {"c": [1, 2]}
+        assert dict["d"] != dict["d"]
+
+    def test_jsons_integer(self):
+        dict = FlatDict.from_jsons('{"a": 18446744073709551616, "b": -9223372036854775809, "c": 9223372036854775807}')
+        assert dict["a"] == 18446744073709551616 and isinstance(dict["a"], int)
+        assert dict["b"] == -9223372036854775809 and isinstance(dict["b"], int)
+        assert dict["c"] == 9223372036854775807
+
 
 class ConfigDict(FlatDict):
     int_value: int
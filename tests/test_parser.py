@@ -22,7 +22,7 @@ from typing import List, Optional
 
 import pytest
 
-from chanfig import Config
+from chanfig import Config, ConfigParser
 
 
 class TestConfig(Config):
@@ -121,3 +121,30 @@ class Test:
             ]
         )
         assert config.true and not config.false
+
+    def test_parse_literal(self):
+        config = Config()
+        config.parse(["--int", "1", "--float", "0.5", "--list", "[1, 2]", "--none", "None", "--str", "path/to/file"])
+        assert config.int == 1
+        assert config.float == 0.5
+        assert config.list == [1, 2]
+        assert config.none is None
+        assert config.str == "path/to/file"
+
+    def test_parse_literal_string(self):
+        config = Config()
+        config.parse(["--tuple", "1, 'a/b'", "--comment", "0.5  # x:y", "--time", "12:30"])
+        assert config.tuple == (1, "a/b")
+        assert config.comment == 0.5
+        assert config.time == "12:30"
+
+    def test_parse_terminator(self, capsys):
+        parser = ConfigParser()
+        with pytest.raises(SystemExit):
+            parser.parse(["--a", "1", "--", "x"])
+        assert "unrecognized arguments" in capsys.readouterr().err
+        parser = ConfigParser()
+        with pytest.raises(SystemExit):
+            parser.parse(["--a", "1", "--", "--b", "2"])
+        assert "--a" in parser
+        assert "--b" not in parser